@@ -1,7 +1,7 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from typing import List, Optional
 from dotenv import load_dotenv
 import os
@@ -85,6 +85,33 @@ async def delete_file(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/export")
+async def export_subjects(subject_ids: Optional[List[str]] = Query(None)):
+    missing = [s for s in (subject_ids or []) if not vector_store.has_subject(s)]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Unknown subjects: {', '.join(missing)}")
+    try:
+        blocks = vector_store.iter_export(subject_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return StreamingResponse(
+        blocks,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": 'attachment; filename="subjects.amnx"'}
+    )
+
+# Plain def so the decode and index.json rewrite run in the threadpool.
+@app.post("/import")
+def import_subjects(
+    file: UploadFile = File(...),
+    replace: bool = Form(False)
+):
+    try:
+        counts = vector_store.import_subjects(file.file, replace=replace)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid export file: {e}")
+    return {"status": "success", "subjects": counts}
+
 @app.post("/chat")
 async def chat(
     subject_id: str = Form(...),
@@ -131,7 +158,7 @@ if os.path.exists(dist_dir):
     @app.get("/{full_path:path}")
     async def serve_frontend(full_path: str):
         # Prevent accessing the API routes or health check
-        if full_path in ["health", "upload", "file", "chat", "study"]:
+        if full_path in ["health", "upload", "file", "export", "import", "chat", "study"]:
             raise HTTPException(status_code=404)
             
         file_path = os.path.join(dist_dir, full_path)
@@ -5,11 +5,30 @@ import os
 import re
 import json
 import math
-from typing import List, Dict
+import zlib
+import gzip
+import struct
+from typing import List, Dict, Iterable, Iterator, Optional, BinaryIO
 from collections import Counter
 
 _store: Dict[str, List[Dict]] = {}
 
+# Export format: gzip stream of binary records, each starting with a 1-byte tag.
+#   S  subject:  u32 len + subject_id, u32 chunk count
+#   C  chunk:    u16 len + filename, u32 page, u16 len + chunk_id, u32 len + content
+#   E  end of stream
+# Strings are raw UTF-8 and integers big-endian, so no JSON is parsed per chunk.
+# chunk_id is always a string (as produced by DocumentProcessor); export rejects others.
+# Only indexed chunks are exported: the original files in uploads/ are not included,
+# since the app never reads them back after indexing.
+EXPORT_MAGIC = b"AMNX"
+EXPORT_VERSION = 1
+MAX_EXPORT_FIELD = 64 * 1024 * 1024
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_REC_SUBJECT = b"S"
+_REC_CHUNK = b"C"
+_REC_END = b"E"
 
 STOP_WORDS = {
     'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
@@ -35,6 +54,48 @@ def _tokenize(text: str) -> List[str]:
     return [t for t in tokens if t not in STOP_WORDS and len(t) > 1]
 
 
+def _pack_str(text: str, length: struct.Struct) -> bytes:
+    data = text.encode("utf-8")
+    return length.pack(len(data)) + data
+
+
+def _check_export_str(value, limit: int, field: str):
+    if not isinstance(value, str):
+        raise ValueError(f"Cannot export non-string {field}: {value!r}")
+    size = len(value.encode("utf-8"))
+    if size > min(limit, MAX_EXPORT_FIELD):
+        raise ValueError(f"Cannot export {field} of {size} bytes: exceeds limit")
+
+
+def _check_export_doc(doc: Dict):
+    """Rejects chunks the importer would refuse, so export never writes an unreadable file."""
+    meta = doc["metadata"]
+    _check_export_str(meta["filename"], 0xFFFF, "filename")
+    _check_export_str(meta["chunk_id"], 0xFFFF, "chunk_id")
+    _check_export_str(doc["content"], 0xFFFFFFFF, "content")
+    page = meta["page"]
+    if not isinstance(page, int) or not 0 <= page <= 0xFFFFFFFF:
+        raise ValueError(f"Cannot export page number {page!r}")
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated export stream")
+    return data
+
+
+def _read_int(stream: BinaryIO, fmt: struct.Struct) -> int:
+    return fmt.unpack(_read_exact(stream, fmt.size))[0]
+
+
+def _read_str(stream: BinaryIO, length: struct.Struct) -> str:
+    size = _read_int(stream, length)
+    if size > MAX_EXPORT_FIELD:
+        raise ValueError(f"Export field of {size} bytes exceeds limit")
+    return _read_exact(stream, size).decode("utf-8")
+
+
 def _compute_idf(all_docs: List[List[str]]) -> Dict[str, float]:
     """Compute IDF scores."""
     n = len(all_docs)
@@ -171,3 +232,128 @@ class VectorStoreManager:
                 "distance": round(1.0 / (1.0 + s), 4)
             })
         return hits
+
+    def has_subject(self, subject_id: str) -> bool:
+        return subject_id in _store
+
+    def iter_export(self, subject_ids: Optional[Iterable[str]] = None) -> Iterator[bytes]:
+        """
+        Returns a generator of compressed export blocks for the given subjects (all if None).
+        Subjects are snapshotted and validated here, before any bytes are produced, so
+        uploads during a streamed export cannot change it and an unexportable chunk
+        raises ValueError up front instead of truncating the download.
+        """
+        if subject_ids is None:
+            subject_ids = list(_store.keys())
+        # Repeated IDs would otherwise be written (and imported) twice.
+        subject_ids = list(dict.fromkeys(subject_ids))
+        snapshot = []
+        for subject_id in subject_ids:
+            if subject_id not in _store:
+                raise KeyError(subject_id)
+            _check_export_str(subject_id, 0xFFFFFFFF, "subject_id")
+            docs = list(_store[subject_id])
+            for doc in docs:
+                _check_export_doc(doc)
+            snapshot.append((subject_id, docs))
+        return self._encode_export(snapshot)
+
+    def _encode_export(self, snapshot: List) -> Iterator[bytes]:
+        # wbits=31 produces a gzip container, readable by import_subjects.
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        out = compressor.compress(EXPORT_MAGIC + bytes([EXPORT_VERSION]))
+        for subject_id, docs in snapshot:
+            out += compressor.compress(_REC_SUBJECT + _pack_str(subject_id, _U32) + _U32.pack(len(docs)))
+            for doc in docs:
+                meta = doc["metadata"]
+                out += compressor.compress(
+                    _REC_CHUNK
+                    + _pack_str(meta["filename"], _U16)
+                    + _U32.pack(meta["page"])
+                    + _pack_str(meta["chunk_id"], _U16)
+                    + _pack_str(doc["content"], _U32)
+                )
+                if len(out) >= 64 * 1024:
+                    yield out
+                    out = b""
+        out += compressor.compress(_REC_END)
+        out += compressor.flush()
+        yield out
+
+    def export_subjects(self, stream: BinaryIO, subject_ids: Optional[Iterable[str]] = None):
+        """Writes a compressed export of the given subjects to a binary stream."""
+        for block in self.iter_export(subject_ids):
+            stream.write(block)
+
+    def import_subjects(self, stream: BinaryIO, replace: bool = False) -> Dict[str, int]:
+        """
+        Reads an export stream into the store. Returns chunk counts per subject.
+        Raises ValueError on a malformed stream; nothing is applied in that case.
+        The whole import is staged in memory and index.json is rewritten once.
+        """
+        try:
+            imported = self._read_export(gzip.GzipFile(fileobj=stream, mode="rb"))
+        except (zlib.error, EOFError, OSError) as e:
+            raise ValueError(f"Corrupt export stream: {e}") from e
+
+        for subject_id, docs in imported.items():
+            if replace or subject_id not in _store:
+                _store[subject_id] = docs
+            else:
+                _store[subject_id].extend(docs)
+        if imported:
+            self._persist()
+        print(f"[VectorStore] Imported {sum(len(d) for d in imported.values())} chunks across {len(imported)} subjects")
+        return {subject_id: len(docs) for subject_id, docs in imported.items()}
+
+    def _read_export(self, reader: BinaryIO) -> Dict[str, List[Dict]]:
+        header = _read_exact(reader, len(EXPORT_MAGIC) + 1)
+        if header[:len(EXPORT_MAGIC)] != EXPORT_MAGIC:
+            raise ValueError("Not a subject export stream")
+        if header[-1] != EXPORT_VERSION:
+            raise ValueError(f"Unsupported export version {header[-1]}")
+
+        imported: Dict[str, List[Dict]] = {}
+        current: Optional[str] = None
+        expected = 0
+
+        def _check_count():
+            if current is not None and len(imported[current]) != expected:
+                raise ValueError(
+                    f"Subject {current} declared {expected} chunks but contained {len(imported[current])}"
+                )
+
+        while True:
+            tag = _read_exact(reader, 1)
+            if tag == _REC_SUBJECT:
+                _check_count()
+                current = _read_str(reader, _U32)
+                if current in imported:
+                    raise ValueError(f"Subject {current} appears twice in export stream")
+                expected = _read_int(reader, _U32)
+                imported[current] = []
+            elif tag == _REC_CHUNK:
+                if current is None:
+                    raise ValueError("Chunk record before subject record")
+                filename = _read_str(reader, _U16)
+                page = _read_int(reader, _U32)
+                chunk_id = _read_str(reader, _U16)
+                content = _read_str(reader, _U32)
+                imported[current].append({
+                    "content": content,
+                    "metadata": {
+                        "filename": filename,
+                        "page": page,
+                        "chunk_id": chunk_id,
+                        "subject_id": current,
+                    }
+                })
+            elif tag == _REC_END:
+                _check_count()
+                # Reading to EOF makes GzipFile verify the CRC32/length trailer
+                # and raise on anything appended after it.
+                if reader.read(1) != b"":
+                    raise ValueError("Unexpected data after end record")
+                return imported
+            else:
+                raise ValueError(f"Unknown record type {tag!r}")
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rag.vector_store as vector_store_module
+from rag.vector_store import VectorStoreManager
+
+
+@pytest.fixture
+def store(tmp_path):
+    vector_store_module._store.clear()
+    yield VectorStoreManager(str(tmp_path / "vector_data"))
+    vector_store_module._store.clear()
@@ -0,0 +1,141 @@
+import gzip
+import io
+import struct
+
+import pytest
+
+import rag.vector_store as vector_store_module
+from rag.vector_store import EXPORT_MAGIC, EXPORT_VERSION, MAX_EXPORT_FIELD
+
+HEADER = EXPORT_MAGIC + bytes([EXPORT_VERSION])
+
+
+def _chunks(n, prefix="chunk"):
+    return [
+        {"content": f"{prefix} text {i} ünïcode", "page_number": i % 3 + 1, "chunk_id": f"p1_c{i}"}
+        for i in range(n)
+    ]
+
+
+def _export(store, subject_ids=None) -> bytes:
+    buf = io.BytesIO()
+    store.export_subjects(buf, subject_ids)
+    return buf.getvalue()
+
+
+def _subject(subject_id: str, count: int) -> bytes:
+    data = subject_id.encode("utf-8")
+    return b"S" + struct.pack(">I", len(data)) + data + struct.pack(">I", count)
+
+
+def _import_raw(store, raw: bytes):
+    return store.import_subjects(io.BytesIO(gzip.compress(raw)))
+
+
+def test_round_trip_preserves_content_and_metadata(store):
+    store.add_documents("s1", _chunks(50), "notes.txt")
+    store.add_documents("s2", _chunks(5, "other"), "other.pdf")
+    original = {k: [dict(d) for d in v] for k, v in vector_store_module._store.items()}
+    data = _export(store)
+
+    vector_store_module._store.clear()
+    assert store.import_subjects(io.BytesIO(data)) == {"s1": 50, "s2": 5}
+    assert vector_store_module._store == original
+
+
+def test_import_appends_by_default_and_replaces_on_request(store):
+    store.add_documents("s1", _chunks(3), "notes.txt")
+    data = _export(store, ["s1"])
+
+    store.import_subjects(io.BytesIO(data))
+    assert len(vector_store_module._store["s1"]) == 6
+    store.import_subjects(io.BytesIO(data), replace=True)
+    assert len(vector_store_module._store["s1"]) == 3
+
+
+def test_export_dedupes_subject_ids(store):
+    store.add_documents("s1", _chunks(1), "notes.txt")
+    data = _export(store, ["s1", "s1"])
+
+    vector_store_module._store.clear()
+    assert store.import_subjects(io.BytesIO(data)) == {"s1": 1}
+
+
+def test_export_snapshots_subject_before_streaming(store):
+    store.add_documents("s1", _chunks(2000), "notes.txt")
+    blocks = store.iter_export(["s1"])
+    first = next(blocks)
+    store.add_documents("s1", _chunks(1, "late"), "late.txt")
+    data = first + b"".join(blocks)
+
+    vector_store_module._store.clear()
+    assert store.import_subjects(io.BytesIO(data)) == {"s1": 2000}
+
+
+def test_export_rejects_unknown_subject(store):
+    with pytest.raises(KeyError):
+        store.iter_export(["missing"])
+
+
+def test_export_rejects_non_string_chunk_id(store):
+    store.add_documents("s1", [{"content": "x", "page_number": 1, "chunk_id": 5}], "notes.txt")
+    with pytest.raises(ValueError):
+        store.iter_export(["s1"])
+
+
+def test_export_rejects_oversized_filename(store):
+    store.add_documents("s1", _chunks(1), "n" * 70000)
+    with pytest.raises(ValueError):
+        store.iter_export(["s1"])
+
+
+@pytest.mark.parametrize("raw, message", [
+    (HEADER + _subject("s1", 3) + b"E", "declared 3 chunks"),
+    (HEADER + _subject("s1", 0) + _subject("s1", 0) + b"E", "appears twice"),
+    (HEADER + b"X", "Unknown record type"),
+    (HEADER + b"S" + struct.pack(">I", MAX_EXPORT_FIELD + 1), "exceeds limit"),
+    (HEADER + _subject("s1", 0), "Truncated"),
+    (b"JUNK" + bytes([EXPORT_VERSION]) + b"E", "Not a subject export"),
+])
+def test_import_rejects_malformed_records(store, raw, message):
+    with pytest.raises(ValueError, match=message):
+        _import_raw(store, raw)
+    assert vector_store_module._store == {}
+
+
+@pytest.mark.parametrize("mangle", [
+    lambda data: data[:len(data) // 2],
+    lambda data: data[:-8],
+    lambda data: data[:-8] + b"\x00\x00\x00\x00" + data[-4:],
+    lambda data: data + b"junkjunk",
+    lambda data: b"not a gzip stream",
+])
+def test_import_rejects_corrupt_stream(store, mangle):
+    store.add_documents("s1", _chunks(20), "notes.txt")
+    data = _export(store, ["s1"])
+    vector_store_module._store.clear()
+
+    with pytest.raises(ValueError):
+        store.import_subjects(io.BytesIO(mangle(data)))
+    assert vector_store_module._store == {}
+
+
+def test_api_export_and_import(store, tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("openai")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.chdir(tmp_path)
+    import main
+
+    client = TestClient(main.app)
+    store.add_documents("s1", _chunks(2), "notes.txt")
+
+    assert client.get("/export", params={"subject_ids": "missing"}).status_code == 404
+    response = client.get("/export", params={"subject_ids": "s1"})
+    assert response.status_code == 200
+
+    assert client.post("/import", files={"file": ("bad.amnx", b"junk")}).status_code == 400
+    response = client.post("/import", files={"file": ("subjects.amnx", response.content)})
+    assert response.status_code == 200
+    assert response.json()["subjects"] == {"s1": 2}